@@ -75,6 +75,10 @@ def analyze(
     # Rewrite any choice or seq nodes that only have one child.
     _rewrite_singles(g)
 
+    # Turn loops over single characters into regexps where the list of
+    # characters itself isn't needed.
+    _rewrite_char_class_loops(g)
+
     # Extract subnodes into their own rules to make codegen easier.
     if rewrite_subrules:
         # Extract subnodes into their own rules to make codegen easier.
@@ -712,6 +716,167 @@ def _rewrite_singles(grammar):
     grammar.update_rules()
 
 
+def _rewrite_char_class_loops(grammar):
+    """Rewrites `star` and `plus` nodes over single-character classes
+    into equivalent `regexp` nodes.
+
+    A loop like `[0-9]*` normally produces a list of single-character
+    strings. When that list is only ever going to be turned back into
+    a string (because the loop is inside a `run`, or because the only
+    references to it are `cat(x)` or `join('', x)`), we can instead
+    match the whole thing with one regexp and return the slice.
+
+    This must run after filler nodes are inserted, so that we only
+    ever rewrite loops that don't allow filler between the characters.
+    """
+
+    def walk(node, in_run):
+        if node.t == 'run':
+            node.ch = [walk(c, True) for c in node.ch]
+            return node
+        if node.t == 'label':
+            # The value of a labeled loop might be used even inside a run.
+            node.ch = [walk(c, False) for c in node.ch]
+            return node
+        if node.t in ('plus', 'star') and in_run:
+            new_node = _char_class_loop(grammar, node)
+            if new_node:
+                return new_node
+        if node.t == 'seq':
+            _rewrite_cat_labels(grammar, node)
+        node.ch = [walk(c, in_run) for c in node.ch]
+        return node
+
+    for rule in grammar.ast.ch:
+        rule.child = walk(rule.child, False)
+    grammar.update_rules()
+
+
+def _rewrite_cat_labels(grammar, seq):
+    # Look for `x:[a-z]* ... -> cat(x)`; if every reference to the label
+    # just turns it back into a string, we can rewrite the label to be
+    # a regexp and the references to refer to the label directly.
+    for i, c in enumerate(seq.ch):
+        if (
+            c.t != 'label'
+            or c.attrs.outer_scope
+            or c.child.t not in ('plus', 'star')
+        ):
+            continue
+        new_node = _char_class_loop(grammar, c.child)
+        if not new_node:
+            continue
+        calls: list[m_grammar.Node] = []
+        if not all(
+            _collect_cat_calls(c.v, sib, calls) for sib in seq.ch[i + 1 :]
+        ):
+            continue
+        c.child = new_node
+        for call in calls:
+            arg = call.ch[-1]
+            call.t = arg.t
+            call.v = arg.v
+            call.ch = arg.ch
+            call.attrs = arg.attrs
+
+
+def _collect_cat_calls(name, node, calls):
+    # Returns False if `name` is referenced in any way other than as
+    # `cat(name)` or `join('', name)`.
+    if node.t == 'e_call_infix' and node.ch[0].t == 'e_ident':
+        fn_name = node.ch[0].v
+        args = node.ch[1:]
+        if (
+            args
+            and args[-1].t == 'e_ident'
+            and args[-1].v == name
+            and (
+                (fn_name == 'cat' and len(args) == 1)
+                or (
+                    fn_name == 'join'
+                    and len(args) == 2
+                    and args[0].t == 'e_lit'
+                    and args[0].v == ''
+                )
+            )
+        ):
+            calls.append(node)
+            return True
+    if node.t == 'e_ident' and node.v == name:
+        return False
+    return all(_collect_cat_calls(name, c, calls) for c in node.ch)
+
+
+def _char_class_loop(grammar, node):
+    # Returns a `regexp` node equivalent to the given `star` or `plus`
+    # node if the latter's child always matches exactly one character,
+    # and None otherwise.
+    child = node.child
+    while child.t == 'paren':
+        child = child.child
+    if child.t == 'set' and child.v.startswith('^'):
+        cls = '[' + child.v + ']'
+    elif child.t == 'not_one':
+        body = _char_class_body(grammar, child.child, set(), alone=True)
+        if body is None:
+            return None
+        cls = '[^' + body + ']'
+    else:
+        body = _char_class_body(grammar, child, set(), alone=True)
+        if body is None:
+            return None
+        cls = '[' + body + ']'
+    return m_grammar.Node('regexp', cls + ('*' if node.t == 'star' else '+'))
+
+
+def _char_class_body(grammar, node, seen, alone):
+    # Returns the contents of a (non-negated) regexp bracket expression
+    # that matches the same single characters as `node`, or None if
+    # there isn't one.
+    if node.t == 'paren':
+        return _char_class_body(grammar, node.child, seen, alone)
+    if node.t == 'lit' and len(node.v) == 1:
+        return _escape_class_char(node.v)
+    if node.t == 'range':
+        return (
+            _escape_class_char(node.v[0])
+            + '-'
+            + _escape_class_char(node.v[1])
+        )
+    if node.t == 'set':
+        if node.v.startswith('^'):
+            return None
+        if not alone and (node.v.startswith('-') or node.v.endswith('-')):
+            # A leading or trailing '-' would combine with a neighbor
+            # into a range.
+            return None
+        return node.v
+    if node.t == 'choice':
+        bodies = [
+            _char_class_body(grammar, c, seen, alone=False) for c in node.ch
+        ]
+        if any(b is None for b in bodies):
+            return None
+        return ''.join(bodies)
+    if (
+        node.t == 'apply'
+        and node.v not in m_grammar.BUILTIN_RULES
+        and node.v not in seen
+        and node.v in grammar.rules
+    ):
+        rule = grammar.rules[node.v]
+        if rule.t == 'rule':
+            rule = rule.child
+        return _char_class_body(grammar, rule, seen | {node.v}, alone)
+    return None
+
+
+def _escape_class_char(ch):
+    if ch in '\\]^-[':
+        return '\\' + ch
+    return ch
+
+
 def _rewrite_subrules(grammar):
     """Extracts subrules from rules as needed to be able to generate
     code properly."""
@@ -810,9 +975,7 @@ class _SubRuleRewriter:
         return self._walkn(node)
 
     def _ty_equals(self, node):
-        self._grammar.needed_operators.append('ch')
         self._grammar.needed_operators.append('str')
-        self._grammar.ch_needed = True
         self._grammar.str_needed = True
         return node
 
@@ -822,9 +985,10 @@ class _SubRuleRewriter:
         return self._split1(node)
 
     def _ty_lit(self, node):
-        self._grammar.needed_operators.append('ch')
-        self._grammar.ch_needed = True
-        if len(node.v) > 1:
+        if len(node.v) == 1:
+            self._grammar.needed_operators.append('ch')
+            self._grammar.ch_needed = True
+        else:
             self._grammar.needed_operators.append('str')
             self._grammar.str_needed = True
         return node
@@ -1,4 +1,4 @@
-# Generated by pyfloyd version 0.28.0
+# Generated by pyfloyd version 0.29.0
 #    https://github.com/dpranke/pyfloyd
 #
 #    `flc -o src/pyfloyd/datafile/parser.py grammars/datafile.g`
@@ -535,19 +535,15 @@ class _Parser:
         self._o_ch("'")
 
     def _s_quote_4(self):
-        vs = []
-        self._o_ch('=')
-        if self._state.failed:
+        rexp = '[=]+'
+        pos = self.pos()
+        if rexp not in self._regexps:
+            self._regexps[rexp] = re.compile(rexp)
+        m = self._regexps[rexp].match(self._text, pos)
+        if m:
+            self._o_succeed(m.group(0), m.end())
             return
-        vs.append(self._state.val)
-        while True:
-            state = self._state.copy()
-            self._o_ch('=')
-            if self._state.failed or self._state.pos == state.pos:
-                self._o_restore(state)
-                break
-            vs.append(self._state.val)
-        self._o_succeed(vs, self._state.pos)
+        self._o_fail()
 
     def _r_numword(self):
         start = self._state.pos
@@ -1575,7 +1571,7 @@ class _Parser:
         if not self._state.failed:
             return
         self._o_restore(state)
-        self._s__comment_9()
+        self._s__comment_8()
 
     def _s__comment_1(self):
         start = self._state.pos
@@ -1590,7 +1586,9 @@ class _Parser:
         if self._state.failed:
             return
         self._s__comment_4()
-        self._s__comment_6()
+        if self._state.failed:
+            return
+        self._s__comment_5()
 
     def _s__comment_3(self):
         state = self._state.copy()
@@ -1601,18 +1599,7 @@ class _Parser:
         self._o_str('//')
 
     def _s__comment_4(self):
-        vs = []
-        while True:
-            state = self._state.copy()
-            self._s__comment_5()
-            if self._state.failed or self._state.pos == state.pos:
-                self._o_restore(state)
-                break
-            vs.append(self._state.val)
-        self._o_succeed(vs, self._state.pos)
-
-    def _s__comment_5(self):
-        rexp = '[^\r\n]'
+        rexp = '[^\r\n]*'
         pos = self.pos()
         if rexp not in self._regexps:
             self._regexps[rexp] = re.compile(rexp)
@@ -1622,25 +1609,25 @@ class _Parser:
             return
         self._o_fail()
 
-    def _s__comment_6(self):
+    def _s__comment_5(self):
         state = self._state.copy()
         self._o_memoize('r_end', self._r_end)
         if not self._state.failed:
             return
         self._o_restore(state)
-        self._s__comment_7()
+        self._s__comment_6()
         if not self._state.failed:
             return
         self._o_restore(state)
         self._o_ch('\n')
 
-    def _s__comment_7(self):
+    def _s__comment_6(self):
         self._o_ch('\r')
         if self._state.failed:
             return
-        self._s__comment_8()
+        self._s__comment_7()
 
-    def _s__comment_8(self):
+    def _s__comment_7(self):
         state = self._state.copy()
         self._o_ch('\n')
         if self._state.failed:
@@ -1648,15 +1635,15 @@ class _Parser:
         else:
             self._o_succeed([self._state.val], self._state.pos)
 
-    def _s__comment_9(self):
+    def _s__comment_8(self):
         start = self._state.pos
-        self._s__comment_10()
+        self._s__comment_9()
         if self._state.failed:
             return
         end = self._state.pos
         self._state.val = self._text[start:end]
 
-    def _s__comment_10(self):
+    def _s__comment_9(self):
         self._o_str('/*')
         if self._state.failed:
             return
@@ -1763,11 +1750,15 @@ class _Parser:
         self._state = state.copy()
 
     def _o_str(self, s):
-        for ch in s:
-            self._o_ch(ch)
-            if self._state.failed:
-                return
-        self._state.val = s
+        pos = self.pos()
+        if self._text.startswith(s, pos):
+            self._o_succeed(s, pos + len(s))
+        else:
+            i = 0
+            while pos + i < self._end and self._text[pos + i] == s[i]:
+                i += 1
+            self._state.pos = pos + i
+            self._o_fail()
 
     def _o_succeed(self, v, newpos):
         self._state.val = v
@@ -1,4 +1,4 @@
-# Generated by pyfloyd version 0.28.0
+# Generated by pyfloyd version 0.29.0
 #    https://github.com/dpranke/pyfloyd
 #
 #    `flc -o src/pyfloyd/grammar_parser.py grammars/floyd.g`
@@ -1076,22 +1076,18 @@ class _Parser:
         self._o_ch('}')
         if self._state.failed:
             return
-        self._o_succeed(self._fn_atou(self._fn_cat(v__2), 16), self._state.pos)
+        self._o_succeed(self._fn_atou(v__2, 16), self._state.pos)
 
     def _s_hex_esc_4(self):
-        vs = []
-        self._o_memoize('r_hex_char', self._r_hex_char)
-        if self._state.failed:
+        rexp = '[0-9a-fA-F]+'
+        pos = self.pos()
+        if rexp not in self._regexps:
+            self._regexps[rexp] = re.compile(rexp)
+        m = self._regexps[rexp].match(self._text, pos)
+        if m:
+            self._o_succeed(m.group(0), m.end())
             return
-        vs.append(self._state.val)
-        while True:
-            state = self._state.copy()
-            self._o_memoize('r_hex_char', self._r_hex_char)
-            if self._state.failed or self._state.pos == state.pos:
-                self._o_restore(state)
-                break
-            vs.append(self._state.val)
-        self._o_succeed(vs, self._state.pos)
+        self._o_fail()
 
     def _r_uni_esc(self):
         state = self._state.copy()
@@ -1149,22 +1145,18 @@ class _Parser:
         self._o_ch('}')
         if self._state.failed:
             return
-        self._o_succeed(self._fn_atou(self._fn_cat(v__2), 16), self._state.pos)
+        self._o_succeed(self._fn_atou(v__2, 16), self._state.pos)
 
     def _s_uni_esc_4(self):
-        vs = []
-        self._o_memoize('r_hex_char', self._r_hex_char)
-        if self._state.failed:
+        rexp = '[0-9a-fA-F]+'
+        pos = self.pos()
+        if rexp not in self._regexps:
+            self._regexps[rexp] = re.compile(rexp)
+        m = self._regexps[rexp].match(self._text, pos)
+        if m:
+            self._o_succeed(m.group(0), m.end())
             return
-        vs.append(self._state.val)
-        while True:
-            state = self._state.copy()
-            self._o_memoize('r_hex_char', self._r_hex_char)
-            if self._state.failed or self._state.pos == state.pos:
-                self._o_restore(state)
-                break
-            vs.append(self._state.val)
-        self._o_succeed(vs, self._state.pos)
+        self._o_fail()
 
     def _s_uni_esc_5(self):
         self._o_str('\\U')
@@ -1460,18 +1452,7 @@ class _Parser:
         self._o_fail()
 
     def _s_zpos_6(self):
-        vs = []
-        while True:
-            state = self._state.copy()
-            self._s_zpos_7()
-            if self._state.failed or self._state.pos == state.pos:
-                self._o_restore(state)
-                break
-            vs.append(self._state.val)
-        self._o_succeed(vs, self._state.pos)
-
-    def _s_zpos_7(self):
-        rexp = '[0-9]'
+        rexp = '[0-9]*'
         pos = self.pos()
         if rexp not in self._regexps:
             self._regexps[rexp] = re.compile(rexp)
@@ -1932,18 +1913,7 @@ class _Parser:
         self._o_fail()
 
     def _s_int_7(self):
-        vs = []
-        while True:
-            state = self._state.copy()
-            self._s_int_8()
-            if self._state.failed or self._state.pos == state.pos:
-                self._o_restore(state)
-                break
-            vs.append(self._state.val)
-        self._o_succeed(vs, self._state.pos)
-
-    def _s_int_8(self):
-        rexp = '[0-9]'
+        rexp = '[0-9]*'
         pos = self.pos()
         if rexp not in self._regexps:
             self._regexps[rexp] = re.compile(rexp)
@@ -1968,19 +1938,15 @@ class _Parser:
         self._s_hex_2()
 
     def _s_hex_2(self):
-        vs = []
-        self._o_memoize('r_hex_char', self._r_hex_char)
-        if self._state.failed:
+        rexp = '[0-9a-fA-F]+'
+        pos = self.pos()
+        if rexp not in self._regexps:
+            self._regexps[rexp] = re.compile(rexp)
+        m = self._regexps[rexp].match(self._text, pos)
+        if m:
+            self._o_succeed(m.group(0), m.end())
             return
-        vs.append(self._state.val)
-        while True:
-            state = self._state.copy()
-            self._o_memoize('r_hex_char', self._r_hex_char)
-            if self._state.failed or self._state.pos == state.pos:
-                self._o_restore(state)
-                break
-            vs.append(self._state.val)
-        self._o_succeed(vs, self._state.pos)
+        self._o_fail()
 
     def _r_hex_char(self):
         rexp = '[0-9a-fA-F]'
@@ -2002,43 +1968,15 @@ class _Parser:
         self._state.val = self._text[start:end]
 
     def _s__whitespace_1(self):
-        vs = []
-        self._s__whitespace_2()
-        if self._state.failed:
-            return
-        vs.append(self._state.val)
-        while True:
-            state = self._state.copy()
-            self._s__whitespace_2()
-            if self._state.failed or self._state.pos == state.pos:
-                self._o_restore(state)
-                break
-            vs.append(self._state.val)
-        self._o_succeed(vs, self._state.pos)
-
-    def _s__whitespace_2(self):
-        state = self._state.copy()
-        self._o_ch(' ')
-        if not self._state.failed:
-            return
-        self._o_restore(state)
-        self._o_ch('\f')
-        if not self._state.failed:
-            return
-        self._o_restore(state)
-        self._o_ch('\n')
-        if not self._state.failed:
-            return
-        self._o_restore(state)
-        self._o_ch('\r')
-        if not self._state.failed:
-            return
-        self._o_restore(state)
-        self._o_ch('\t')
-        if not self._state.failed:
+        rexp = '[ \f\n\r\t\v]+'
+        pos = self.pos()
+        if rexp not in self._regexps:
+            self._regexps[rexp] = re.compile(rexp)
+        m = self._regexps[rexp].match(self._text, pos)
+        if m:
+            self._o_succeed(m.group(0), m.end())
             return
-        self._o_restore(state)
-        self._o_ch('\v')
+        self._o_fail()
 
     def _r__comment(self):
         state = self._state.copy()
@@ -2046,7 +1984,7 @@ class _Parser:
         if not self._state.failed:
             return
         self._o_restore(state)
-        self._s__comment_6()
+        self._s__comment_5()
 
     def _s__comment_1(self):
         start = self._state.pos
@@ -2071,18 +2009,7 @@ class _Parser:
         self._o_ch('#')
 
     def _s__comment_4(self):
-        vs = []
-        while True:
-            state = self._state.copy()
-            self._s__comment_5()
-            if self._state.failed or self._state.pos == state.pos:
-                self._o_restore(state)
-                break
-            vs.append(self._state.val)
-        self._o_succeed(vs, self._state.pos)
-
-    def _s__comment_5(self):
-        rexp = '[^\r\n]'
+        rexp = '[^\r\n]*'
         pos = self.pos()
         if rexp not in self._regexps:
             self._regexps[rexp] = re.compile(rexp)
@@ -2092,15 +2019,15 @@ class _Parser:
             return
         self._o_fail()
 
-    def _s__comment_6(self):
+    def _s__comment_5(self):
         start = self._state.pos
-        self._s__comment_7()
+        self._s__comment_6()
         if self._state.failed:
             return
         end = self._state.pos
         self._state.val = self._text[start:end]
 
-    def _s__comment_7(self):
+    def _s__comment_6(self):
         self._o_str('/*')
         if self._state.failed:
             return
@@ -2197,11 +2124,15 @@ class _Parser:
         self._state = state.copy()
 
     def _o_str(self, s):
-        for ch in s:
-            self._o_ch(ch)
-            if self._state.failed:
-                return
-        self._state.val = s
+        pos = self.pos()
+        if self._text.startswith(s, pos):
+            self._o_succeed(s, pos + len(s))
+        else:
+            i = 0
+            while pos + i < self._end and self._text[pos + i] == s[i]:
+                i += 1
+            self._state.pos = pos + i
+            self._o_fail()
 
     def _o_succeed(self, v, newpos):
         self._state.val = v
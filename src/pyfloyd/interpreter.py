@@ -107,19 +107,21 @@ class Interpreter:
             self._errstr = errstr
 
     def _str(self, s):
-        s_len = len(s)
         pos = self._pos
-        i = 0
-        while (
-            i < s_len
-            and self._pos < self._end
-            and self._text[self._pos] == s[i]
-        ):
-            self._pos += 1
-            i += 1
-        if i == s_len:
-            self._succeed(self._text[pos : self._pos])
+        if self._text.startswith(s, pos):
+            self._succeed(s, pos + len(s))
         else:
+            # Advance to the first mismatched character so that the error
+            # is reported at the same place a char-by-char match would.
+            i = 0
+            s_len = len(s)
+            while (
+                i < s_len
+                and pos + i < self._end
+                and self._text[pos + i] == s[i]
+            ):
+                i += 1
+            self._pos = pos + i
             self._fail()
         self._tok(pos, False)
 
@@ -1,4 +1,4 @@
-# Generated by pyfloyd version 0.28.0
+# Generated by pyfloyd version 0.29.0
 #    https://github.com/dpranke/pyfloyd
 #
 #    `flc -o src/pyfloyd/lisp_parser.py grammars/lisp.g`
@@ -489,11 +489,15 @@ class _Parser:
         self._state = state.copy()
 
     def _o_str(self, s):
-        for ch in s:
-            self._o_ch(ch)
-            if self._state.failed:
-                return
-        self._state.val = s
+        pos = self.pos()
+        if self._text.startswith(s, pos):
+            self._o_succeed(s, pos + len(s))
+        else:
+            i = 0
+            while pos + i < self._end and self._text[pos + i] == s[i]:
+                i += 1
+            self._state.pos = pos + i
+            self._o_fail()
 
     def _o_succeed(self, v, newpos):
         self._state.val = v
@@ -1051,11 +1051,15 @@ _BUILTINS = {
         """,
     'str': """
         def _o_str(self, s):
-            for ch in s:
-                self._o_ch(ch)
-                if self._failed:
-                    return
-            self._val = s
+            p = self._pos
+            if self._text.startswith(s, p):
+                self._o_succeed(s, p + len(s))
+            else:
+                i = 0
+                while p + i < self._end and self._text[p + i] == s[i]:
+                    i += 1
+                self._pos = p + i
+                self._o_fail()
         """,
     'succeed': """
         def _o_succeed(self, v, newpos=None):
@@ -345,6 +345,22 @@ class RulesMixin:
     def test_lit_str(self):
         self.check("grammar = ('foo')*", 'foofoo')
 
+    def test_lit_str_empty(self):
+        self.check("grammar = '' 'a'", 'a')
+
+    def test_lit_str_partial_match(self):
+        grammar = "grammar = 'foobar' end"
+        self.check(
+            grammar,
+            'foobaz',
+            err='<string>:1 Unexpected "z" at column 6',
+        )
+        self.check(
+            grammar,
+            'fooba',
+            err='<string>:1 Unexpected end of input at column 6',
+        )
+
     def test_long_unicode_literals(self):
         self.check("grammar = '\\U00000020'", ' ')
 